@@ -8,8 +8,12 @@ logger = logging.getLogger(__name__)
 class AIService:
     """Service to handle interactions with Google Gemini AI using the latest google-genai SDK."""
     
-    def __init__(self, api_key):
-        """Initialize Gemini with the provided API key."""
+    def __init__(self, api_key, rate_limiter=None):
+        """
+        Initialize Gemini with the provided API key.
+        An optional rate_limiter (any object with a wait() method) is called before each request.
+        """
+        self.rate_limiter = rate_limiter
         if not api_key:
             logger.warning("Gemini API key not provided. AI features will be disabled.")
             self.client = None
@@ -63,6 +67,8 @@ class AIService:
         """
 
         try:
+            if self.rate_limiter:
+                self.rate_limiter.wait()
             response = self.client.models.generate_content(
                 model=self.model_name,
                 contents=prompt
@@ -0,0 +1,311 @@
+"""
+Offline Bulk Resume Scoring CLI
+Scores a directory or archive (.zip, .tar, .tar.gz) of resumes on all CPU cores
+and writes one NDJSON record per resume, without going through the Flask server.
+
+Usage:
+    python batch_score.py resumes/ -o results.ndjson --role "Data Scientist"
+    python batch_score.py resumes.zip -o results.ndjson --all-roles --resume --save-history
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import tarfile
+import zipfile
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from pymongo.errors import PyMongoError
+from config import Config
+from database import db, connect_db
+from models import AnalysisHistory
+from routes.api import extract_text_from_file
+from skill_analyzer import SkillAnalyzer
+
+logger = logging.getLogger(__name__)
+
+class BatchAborted(Exception):
+    """Raised when a run stops early because of a worker or database failure."""
+
+class RateLimiter:
+    """Spaces out calls evenly across all worker processes (shared lock + next free slot)."""
+
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute
+        self._lock = multiprocessing.Lock()
+        self._next_slot = multiprocessing.Value('d', 0.0, lock=False)
+
+    def wait(self):
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def _has_allowed_ext(name):
+    return '.' in name and name.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
+
+def input_kind(input_path):
+    """Classify input_path as 'dir', 'zip', 'tar' or 'file'; raise ValueError if it can't be read."""
+    if not os.path.exists(input_path):
+        raise ValueError(f"Input not found: {input_path}")
+    if os.path.isdir(input_path):
+        return 'dir'
+    # Checked before archive detection: a .docx resume is itself a zip file
+    if os.path.isfile(input_path) and _has_allowed_ext(input_path):
+        return 'file'
+    if zipfile.is_zipfile(input_path):
+        return 'zip'
+    if tarfile.is_tarfile(input_path):
+        return 'tar'
+    raise ValueError(f"Unsupported input: {input_path}")
+
+def iter_tasks(input_path):
+    """
+    Yield (kind, source, payload) tasks for every resume under input_path.
+    'source' is a stable key used for checkpointing; payload is a path, a zip member
+    reference (read by the worker) or raw bytes (tar members can't be read randomly).
+    """
+    kind = input_kind(input_path)
+    if kind == 'dir':
+        for root, dirs, files in os.walk(input_path):
+            dirs.sort()
+            for name in sorted(files):
+                if _has_allowed_ext(name):
+                    path = os.path.join(root, name)
+                    yield 'file', os.path.relpath(path, input_path).replace(os.sep, '/'), path
+    elif kind == 'zip':
+        with zipfile.ZipFile(input_path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir() and _has_allowed_ext(info.filename):
+                    yield 'zip', info.filename, (input_path, info.filename)
+    elif kind == 'tar':
+        with tarfile.open(input_path, 'r:*') as archive:
+            for member in archive:
+                if member.isfile() and _has_allowed_ext(member.name):
+                    yield 'bytes', member.name, archive.extractfile(member).read()
+    else:
+        yield 'file', os.path.basename(input_path), input_path
+
+def load_checkpoint(output_path):
+    """
+    Return the set of sources already written to output_path.
+    Only a final line without a trailing newline (an interrupted write) is truncated away;
+    any other unreadable line raises ValueError and the file is left untouched.
+    """
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    valid_end = 0
+    with open(output_path, 'rb') as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.endswith(b'\n'):
+                break  # only the last line can lack a newline
+            try:
+                done.add(json.loads(line)['source'])
+            except (ValueError, KeyError, TypeError):
+                raise ValueError(f"{output_path} line {line_no} is not a batch_score record; refusing to resume from it")
+            valid_end += len(line)
+
+    if valid_end < os.path.getsize(output_path):
+        logger.warning(f"Truncating incomplete last line of {output_path}")
+        with open(output_path, 'r+b') as f:
+            f.truncate(valid_end)
+    return done
+
+# Per-worker state, set up once by _init_worker
+_analyzer = None
+_roles = None
+_zip_cache = {}
+
+def _init_worker(api_key, roles, rate_limiter):
+    global _analyzer, _roles
+    _analyzer = SkillAnalyzer(api_key=api_key, rate_limiter=rate_limiter)
+    _roles = roles
+
+def _extract_from_bytes(name, data):
+    ext = name.rsplit('.', 1)[1].lower()
+    with tempfile.NamedTemporaryFile(suffix='.' + ext, delete=False) as tmp:
+        tmp.write(data)
+    try:
+        return extract_text_from_file(tmp.name)
+    finally:
+        os.remove(tmp.name)
+
+def _read_text(kind, source, payload):
+    if kind == 'file':
+        return extract_text_from_file(payload)
+    if kind == 'zip':
+        archive_path, member = payload
+        if archive_path not in _zip_cache:
+            _zip_cache[archive_path] = zipfile.ZipFile(archive_path)
+        return _extract_from_bytes(source, _zip_cache[archive_path].read(member))
+    return _extract_from_bytes(source, payload)
+
+def score_task(task):
+    """
+    Worker entry point: extract skills once, then score against every requested role.
+    If AI enrichment fails for any role the record carries 'ai_error' instead of results.
+    """
+    kind, source, payload = task
+    try:
+        text = _read_text(kind, source, payload)
+        if not text:
+            return {'source': source, 'error': 'Failed to extract text from file'}
+
+        found_skills = _analyzer.extract_skills(text)
+        results = {role: _analyzer.analyze(text, role, found_skills=found_skills) for role in _roles}
+        ai_failed = [role for role, result in results.items() if result.get('ai_error')]
+        if ai_failed:
+            return {'source': source, 'ai_error': f"AI enrichment failed for: {', '.join(ai_failed)}"}
+        return {'source': source, 'results': results}
+    except Exception as e:
+        return {'source': source, 'error': str(e)}
+
+def run(args):
+    available = SkillAnalyzer.get_available_roles()  # no NLP pipeline load in the parent
+    roles = available if args.all_roles else args.role
+    unknown = [r for r in roles if r not in available]
+    if unknown:
+        raise ValueError(f"Job role not supported: {', '.join(unknown)}")
+
+    # Validate the input before the output file is opened (and truncated in 'w' mode)
+    input_kind(args.input)
+
+    api_key = Config.GEMINI_API_KEY if args.ai else None
+    if args.ai and not api_key:
+        logger.warning("--ai requested but GEMINI_API_KEY is not set. AI enrichment will be skipped.")
+    rate_limiter = RateLimiter(args.ai_rpm) if api_key else None
+
+    if args.save_history:
+        try:
+            connect_db(Config.MONGO_URI)
+            db.ping()
+        except PyMongoError as e:
+            raise BatchAborted(f"Cannot reach MongoDB for --save-history: {str(e)}") from e
+
+    done = load_checkpoint(args.output) if args.resume else set()
+    if done:
+        logger.info(f"Resuming: {len(done)} resumes already scored")
+
+    stats = {'scored': 0, 'failed': 0, 'ai_failed': 0, 'skipped': 0}
+    batch = []
+
+    def flush(out):
+        # History is inserted before the NDJSON lines are written, so a crash in between
+        # re-inserts a batch on resume rather than silently dropping it.
+        if args.save_history:
+            AnalysisHistory.save_many([
+                AnalysisHistory.from_result(result)
+                for record in batch if 'results' in record
+                for result in record['results'].values()
+            ])
+        for record in batch:
+            out.write(json.dumps(record) + '\n')
+        out.flush()
+        batch.clear()
+        logger.info(f"Scored {stats['scored']}, failed {stats['failed']}, AI failed {stats['ai_failed']}, skipped {stats['skipped']}")
+
+    def collect(futures, out):
+        # Keep every result that did finish before re-raising a pool failure
+        pool_error = None
+        for future in futures:
+            try:
+                record = future.result()
+            except BrokenProcessPool as e:
+                pool_error = pool_error or e
+                continue
+            if 'ai_error' in record:
+                # Not written or checkpointed, so --resume retries the enrichment
+                stats['ai_failed'] += 1
+                logger.warning(f"{record['source']}: {record['ai_error']}")
+                continue
+            stats['failed' if 'error' in record else 'scored'] += 1
+            batch.append(record)
+            if len(batch) >= args.batch_size:
+                flush(out)
+        if pool_error:
+            raise pool_error
+
+    workers = args.workers or os.cpu_count() or 1
+    max_pending = workers * 4  # bound memory when tar members are shipped as bytes
+
+    with open(args.output, 'a' if args.resume else 'w', encoding='utf-8') as out, \
+            ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                initargs=(api_key, roles, rate_limiter)) as pool:
+        pending = set()
+        try:
+            for task in iter_tasks(args.input):
+                source = task[1]
+                if source in done:
+                    stats['skipped'] += 1
+                    continue
+                done.add(source)
+
+                pending.add(pool.submit(score_task, task))
+                if len(pending) >= max_pending:
+                    finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(finished, out)
+
+            collect(wait(pending).done, out)
+            flush(out)
+        except (BrokenProcessPool, PyMongoError) as e:
+            pool.shutdown(wait=False, cancel_futures=True)
+            reason = "A worker process died" if isinstance(e, BrokenProcessPool) else "Saving history failed"
+            try:
+                flush(out)
+            except PyMongoError:
+                # The batch is not written to the output either, so --resume rescores it
+                logger.error(f"Could not save the last {len(batch)} results; they will be rescored on --resume")
+            raise BatchAborted(f"{reason}: {str(e)}. Restart with --resume to continue.") from e
+
+    return stats
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Score a directory or archive of resumes offline.")
+    parser.add_argument('input', help="Directory, .zip/.tar/.tar.gz archive, or single resume file")
+    parser.add_argument('-o', '--output', required=True, help="NDJSON output file (also the resume checkpoint)")
+    role_group = parser.add_mutually_exclusive_group(required=True)
+    role_group.add_argument('-r', '--role', action='append', help="Job role to score against (repeatable)")
+    role_group.add_argument('--all-roles', action='store_true', help="Score against every supported role")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument('--resume', action='store_true', help="Skip resumes already present in the output file")
+    parser.add_argument('--save-history', action='store_true', help="Bulk insert results into analysis history")
+    parser.add_argument('--batch-size', type=int, default=100, help="Records per output flush / history insert")
+    parser.add_argument('--ai', action='store_true', help="Enable Gemini enrichment (needs GEMINI_API_KEY)")
+    parser.add_argument('--ai-rpm', type=float, default=60, help="Max Gemini requests per minute across all workers")
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers <= 0:
+        parser.error("--workers must be greater than 0")
+    if args.batch_size <= 0:
+        parser.error("--batch-size must be greater than 0")
+    if args.ai_rpm <= 0:
+        parser.error("--ai-rpm must be greater than 0")
+    return args
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO)
+    args = parse_args(argv)
+    try:
+        stats = run(args)
+    except (ValueError, BatchAborted) as e:
+        logger.error(str(e))
+        return 1
+    logger.info(f"Done. Scored {stats['scored']}, failed {stats['failed']}, "
+                f"AI failed {stats['ai_failed']}, skipped {stats['skipped']}")
+    if stats['ai_failed']:
+        logger.warning(f"{stats['ai_failed']} resumes were not written because AI enrichment failed. "
+                       "Re-run with --resume (or a lower --ai-rpm) to retry them.")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
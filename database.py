@@ -17,13 +17,23 @@ class MongoDB:
             raise RuntimeError("Database not initialized.")
         return self.db.list_collection_names()
 
+    def ping(self):
+        """Round-trip to the server; MongoClient connects lazily, so this surfaces connection errors early."""
+        if self.db is None:
+            raise RuntimeError("Database not initialized.")
+        return self.db.command('ping')
+
 db = MongoDB()
 
 def init_db(app):
     """Initialize MongoDB with the Flask app configuration."""
+    connect_db(app.config['MONGO_URI'])
+
+def connect_db(mongo_uri):
+    """Initialize MongoDB from a connection URI (usable without a Flask app)."""
     try:
-        client = MongoClient(app.config['MONGO_URI'])
-        db_name = app.config['MONGO_URI'].split('/')[-1].split('?')[0]
+        client = MongoClient(mongo_uri)
+        db_name = mongo_uri.split('/')[-1].split('?')[0]
         if not db_name:
             db_name = 'resume_analyzer_db'
         
@@ -8,9 +8,30 @@ class AnalysisHistory:
     COLLECTION_NAME = 'analysis_history'
 
     @staticmethod
-    def save(data):
-        """Save analysis record to MongoDB."""
-        record = {
+    def from_result(result):
+        """Build history data from a SkillAnalyzer.analyze() result."""
+        ai_insights = result.get('ai_insights', {})
+        data = {
+            'job_role': result['job_role'],
+            'match_percentage': result['match_percentage'],
+            'readiness_score': result.get('readiness_score'),
+            'matched_skills': result['matched_skills'],
+            'missing_skills': result['missing_skills'],
+            'rating': result['analysis_summary']['rating'],
+            'summary_message': result['analysis_summary']['message'],
+            'best_fit_role': ai_insights.get('best_fit_role'),
+            'best_fit_reason': ai_insights.get('best_fit_reason')
+        }
+
+        # Add AI insights if they exist
+        if ai_insights:
+            data['semantic_summary'] = ai_insights['semantic_summary']
+            data['ai_recommendations'] = ai_insights['curated_recommendations']
+        return data
+
+    @staticmethod
+    def _build_record(data):
+        return {
             'timestamp': datetime.utcnow(),
             'job_role': data.get('job_role'),
             'match_percentage': data.get('match_percentage'),
@@ -24,8 +45,21 @@ class AnalysisHistory:
             'best_fit_role': data.get('best_fit_role'),
             'best_fit_reason': data.get('best_fit_reason')
         }
+
+    @staticmethod
+    def save(data):
+        """Save analysis record to MongoDB."""
+        record = AnalysisHistory._build_record(data)
         return db[AnalysisHistory.COLLECTION_NAME].insert_one(record)
 
+    @staticmethod
+    def save_many(items):
+        """Save a batch of analysis records to MongoDB in one round trip."""
+        records = [AnalysisHistory._build_record(data) for data in items]
+        if not records:
+            return None
+        return db[AnalysisHistory.COLLECTION_NAME].insert_many(records, ordered=False)
+
     @staticmethod
     def get_all(limit=10):
         """Retrieve recent analysis history."""
@@ -2,12 +2,15 @@ from flask import Blueprint, request, jsonify, current_app
 from werkzeug.utils import secure_filename
 import os
 import json
+import logging
 from skill_analyzer import SkillAnalyzer
 from database import db
 from models import AnalysisHistory
 import PyPDF2
 import docx
 
+logger = logging.getLogger(__name__)
+
 api_bp = Blueprint('api', __name__)
 _skill_analyzer = None
 
@@ -22,7 +25,7 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in current_app.config['ALLOWED_EXTENSIONS']
 
 def extract_text_from_file(filepath):
-    """Extract text based on file extension."""
+    """Extract text based on file extension. Safe to call outside a request context."""
     ext = filepath.rsplit('.', 1)[1].lower()
     try:
         if ext == 'pdf':
@@ -39,7 +42,7 @@ def extract_text_from_file(filepath):
             with open(filepath, 'r', encoding='utf-8') as f:
                 return f.read()
     except Exception as e:
-        current_app.logger.error(f"Text extraction error: {str(e)}")
+        logger.error(f"Text extraction error: {str(e)}")
         return None
     return None
 
@@ -88,23 +91,7 @@ def analyze_resume():
             return jsonify(result), 400
 
         # Save to History
-        history_data = {
-            'job_role': job_role,
-            'match_percentage': result['match_percentage'],
-            'readiness_score': result.get('readiness_score'),
-            'matched_skills': result['matched_skills'],
-            'missing_skills': result['missing_skills'],
-            'rating': result['analysis_summary']['rating'],
-            'summary_message': result['analysis_summary']['message'],
-            'best_fit_role': result.get('ai_insights', {}).get('best_fit_role'),
-            'best_fit_reason': result.get('ai_insights', {}).get('best_fit_reason')
-        }
-        
-        # Add AI insights if they exist
-        if result.get('ai_insights'):
-            history_data['semantic_summary'] = result['ai_insights']['semantic_summary']
-            history_data['ai_recommendations'] = result['ai_insights']['curated_recommendations']
-            
+        history_data = AnalysisHistory.from_result(result)
         save_result = AnalysisHistory.save(history_data)
 
         # Add history ID to result
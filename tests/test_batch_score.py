@@ -0,0 +1,222 @@
+import io
+import json
+import tarfile
+import zipfile
+import pytest
+from pymongo.errors import PyMongoError
+import batch_score
+from batch_score import load_checkpoint, input_kind, iter_tasks, parse_args, RateLimiter
+
+def _record(source):
+    return json.dumps({'source': source, 'results': {}}) + '\n'
+
+# load_checkpoint
+
+def test_load_checkpoint_missing_file(tmp_path):
+    assert load_checkpoint(str(tmp_path / 'out.ndjson')) == set()
+
+def test_load_checkpoint_truncates_partial_last_line(tmp_path):
+    path = tmp_path / 'out.ndjson'
+    valid = _record('a.txt') + _record('b.txt')
+    path.write_text(valid + '{"source": "c.t')
+
+    assert load_checkpoint(str(path)) == {'a.txt', 'b.txt'}
+    assert path.read_text() == valid
+
+def test_load_checkpoint_rejects_corrupt_middle_line(tmp_path):
+    path = tmp_path / 'out.ndjson'
+    content = _record('a.txt') + 'not json\n' + _record('b.txt')
+    path.write_text(content)
+
+    with pytest.raises(ValueError, match='line 2'):
+        load_checkpoint(str(path))
+    assert path.read_text() == content
+
+@pytest.mark.parametrize('content', [
+    'Meeting notes\n- call recruiter\n',
+    '[1]\n',
+    '{"id": 1}\n',
+])
+def test_load_checkpoint_rejects_foreign_file(tmp_path, content):
+    path = tmp_path / 'notes.txt.ndjson'
+    path.write_text(content)
+
+    with pytest.raises(ValueError):
+        load_checkpoint(str(path))
+    assert path.read_text() == content
+
+# iter_tasks
+
+def _sources(input_path):
+    return [(kind, source) for kind, source, _ in iter_tasks(str(input_path))]
+
+def test_iter_tasks_directory(tmp_path):
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'a.txt').write_text('python')
+    (tmp_path / 'sub' / 'b.pdf').write_bytes(b'%PDF')
+    (tmp_path / 'photo.jpg').write_bytes(b'')
+
+    assert _sources(tmp_path) == [('file', 'a.txt'), ('file', 'sub/b.pdf')]
+
+def test_iter_tasks_zip(tmp_path):
+    archive = tmp_path / 'resumes.zip'
+    with zipfile.ZipFile(archive, 'w') as zf:
+        zf.writestr('a.txt', 'python')
+        zf.writestr('sub/b.docx', b'')
+        zf.writestr('photo.jpg', b'')
+
+    tasks = list(iter_tasks(str(archive)))
+    assert [(kind, source) for kind, source, _ in tasks] == [('zip', 'a.txt'), ('zip', 'sub/b.docx')]
+    assert tasks[0][2] == (str(archive), 'a.txt')
+
+def test_iter_tasks_tar(tmp_path):
+    archive = tmp_path / 'resumes.tar.gz'
+    with tarfile.open(archive, 'w:gz') as tf:
+        for name, data in [('a.txt', b'python'), ('photo.jpg', b'')]:
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tf.addfile(info, io.BytesIO(data))
+
+    assert list(iter_tasks(str(archive))) == [('bytes', 'a.txt', b'python')]
+
+def test_iter_tasks_single_txt_file(tmp_path):
+    resume = tmp_path / 'resume.txt'
+    resume.write_text('python')
+
+    assert list(iter_tasks(str(resume))) == [('file', 'resume.txt', str(resume))]
+
+def test_iter_tasks_single_docx_file_is_not_treated_as_archive(tmp_path):
+    resume = tmp_path / 'resume.docx'
+    with zipfile.ZipFile(resume, 'w') as zf:
+        zf.writestr('[Content_Types].xml', '<Types/>')
+        zf.writestr('word/document.xml', '<w:document/>')
+
+    assert input_kind(str(resume)) == 'file'
+    assert list(iter_tasks(str(resume))) == [('file', 'resume.docx', str(resume))]
+
+def test_iter_tasks_rejects_missing_and_unsupported_input(tmp_path):
+    with pytest.raises(ValueError, match='not found'):
+        list(iter_tasks(str(tmp_path / 'missing')))
+    (tmp_path / 'photo.jpg').write_bytes(b'')
+    with pytest.raises(ValueError, match='Unsupported'):
+        list(iter_tasks(str(tmp_path / 'photo.jpg')))
+
+# RateLimiter / parse_args
+
+def test_rate_limiter_spaces_calls(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(batch_score.time, 'time', lambda: 100.0)
+    monkeypatch.setattr(batch_score.time, 'sleep', sleeps.append)
+
+    limiter = RateLimiter(per_minute=30)
+    for _ in range(3):
+        limiter.wait()
+
+    assert sleeps == [2.0, 4.0]
+
+@pytest.mark.parametrize('option', ['--ai-rpm', '--workers', '--batch-size'])
+@pytest.mark.parametrize('value', ['0', '-1'])
+def test_parse_args_rejects_non_positive_values(option, value):
+    with pytest.raises(SystemExit):
+        parse_args(['resumes', '-o', 'out.ndjson', '--all-roles', option, value])
+
+# score_task
+
+class _FakeAnalyzer:
+    def __init__(self, ai_ok=True):
+        self.ai_ok = ai_ok
+
+    def extract_skills(self, text):
+        return set(text.split())
+
+    def analyze(self, text, job_role, found_skills=None):
+        result = {'job_role': job_role, 'matched_skills': sorted(found_skills)}
+        if not self.ai_ok:
+            result['ai_error'] = 'Advanced AI analysis failed'
+        return result
+
+def test_score_task_scores_every_role(tmp_path, monkeypatch):
+    resume = tmp_path / 'a.txt'
+    resume.write_text('python sql')
+    monkeypatch.setattr(batch_score, '_analyzer', _FakeAnalyzer())
+    monkeypatch.setattr(batch_score, '_roles', ['Data Analyst', 'Data Scientist'])
+
+    record = batch_score.score_task(('file', 'a.txt', str(resume)))
+
+    assert record['source'] == 'a.txt'
+    assert set(record['results']) == {'Data Analyst', 'Data Scientist'}
+    assert record['results']['Data Analyst']['matched_skills'] == ['python', 'sql']
+
+def test_score_task_flags_failed_ai_enrichment(tmp_path, monkeypatch):
+    resume = tmp_path / 'a.txt'
+    resume.write_text('python')
+    monkeypatch.setattr(batch_score, '_analyzer', _FakeAnalyzer(ai_ok=False))
+    monkeypatch.setattr(batch_score, '_roles', ['Data Analyst'])
+
+    record = batch_score.score_task(('file', 'a.txt', str(resume)))
+
+    assert 'results' not in record
+    assert 'Data Analyst' in record['ai_error']
+
+# run
+
+@pytest.fixture
+def resume_dir(tmp_path):
+    resumes = tmp_path / 'resumes'
+    (resumes / 'sub').mkdir(parents=True)
+    (resumes / 'a.txt').write_text('Skills: Python, SQL and Docker')
+    (resumes / 'sub' / 'b.txt').write_text('Reporting in Excel and Tableau')
+    return resumes
+
+def _run(resume_dir, output, *extra):
+    return batch_score.run(parse_args([str(resume_dir), '-o', str(output), '-r', 'Data Analyst', '-w', '1', *extra]))
+
+def _read_records(output):
+    return {record['source']: record for record in map(json.loads, output.read_text().splitlines())}
+
+def test_run_writes_ndjson_and_resume_skips_everything(resume_dir, tmp_path):
+    output = tmp_path / 'out.ndjson'
+
+    stats = _run(resume_dir, output)
+
+    assert stats == {'scored': 2, 'failed': 0, 'ai_failed': 0, 'skipped': 0}
+    records = _read_records(output)
+    assert set(records) == {'a.txt', 'sub/b.txt'}
+    assert list(records['a.txt']['results']) == ['Data Analyst']
+    assert records['a.txt']['results']['Data Analyst']['matched_skills'] == ['python', 'sql']
+    assert records['sub/b.txt']['results']['Data Analyst']['matched_skills'] == ['excel', 'tableau']
+
+    content = output.read_text()
+    stats = _run(resume_dir, output, '--resume')
+
+    assert stats == {'scored': 0, 'failed': 0, 'ai_failed': 0, 'skipped': 2}
+    assert output.read_text() == content
+
+def _fake_history(monkeypatch, save_many):
+    monkeypatch.setattr(batch_score, 'connect_db', lambda uri: None)
+    monkeypatch.setattr(batch_score.db, 'ping', lambda: None)
+    monkeypatch.setattr(batch_score.AnalysisHistory, 'save_many', save_many)
+
+def test_run_saves_history_before_writing_output(resume_dir, tmp_path, monkeypatch):
+    output = tmp_path / 'out.ndjson'
+    calls = []
+
+    def save_many(items):
+        calls.append((len(items), output.read_text()))
+    _fake_history(monkeypatch, save_many)
+
+    _run(resume_dir, output, '--save-history', '--batch-size', '10')
+
+    assert calls == [(2, '')]
+    assert len(output.read_text().splitlines()) == 2
+
+def test_run_aborts_without_writing_unsaved_batch(resume_dir, tmp_path, monkeypatch):
+    output = tmp_path / 'out.ndjson'
+
+    def save_many(items):
+        raise PyMongoError('connection lost')
+    _fake_history(monkeypatch, save_many)
+
+    with pytest.raises(batch_score.BatchAborted, match='--resume'):
+        _run(resume_dir, output, '--save-history')
+    assert output.read_text() == ''
@@ -0,0 +1,74 @@
+from datetime import datetime
+import pytest
+import models
+from models import AnalysisHistory
+
+RESULT = {
+    'job_role': 'Data Analyst',
+    'match_percentage': 40,
+    'readiness_score': 55,
+    'matched_skills': ['python', 'sql'],
+    'missing_skills': ['r'],
+    'analysis_summary': {'rating': 'Fair', 'message': 'Some overlap found.'},
+    'ai_insights': {
+        'semantic_summary': 'Strong SQL background.',
+        'curated_recommendations': ['Learn R'],
+        'best_fit_role': 'Data Engineer',
+        'best_fit_reason': 'Pipeline experience.'
+    }
+}
+
+def test_from_result_matches_analyze_route_fields():
+    assert AnalysisHistory.from_result(RESULT) == {
+        'job_role': 'Data Analyst',
+        'match_percentage': 40,
+        'readiness_score': 55,
+        'matched_skills': ['python', 'sql'],
+        'missing_skills': ['r'],
+        'rating': 'Fair',
+        'summary_message': 'Some overlap found.',
+        'best_fit_role': 'Data Engineer',
+        'best_fit_reason': 'Pipeline experience.',
+        'semantic_summary': 'Strong SQL background.',
+        'ai_recommendations': ['Learn R']
+    }
+
+def test_from_result_without_ai_insights():
+    result = {k: v for k, v in RESULT.items() if k != 'ai_insights'}
+
+    data = AnalysisHistory.from_result(result)
+
+    assert data['best_fit_role'] is None
+    assert data['best_fit_reason'] is None
+    assert 'semantic_summary' not in data
+    assert 'ai_recommendations' not in data
+
+class _FakeCollection:
+    def __init__(self):
+        self.inserted = []
+
+    def insert_many(self, records, ordered=True):
+        self.inserted.append((records, ordered))
+        return 'ok'
+
+@pytest.fixture
+def collection(monkeypatch):
+    collection = _FakeCollection()
+    monkeypatch.setattr(models, 'db', {AnalysisHistory.COLLECTION_NAME: collection})
+    return collection
+
+def test_save_many_inserts_one_batch(collection):
+    data = AnalysisHistory.from_result(RESULT)
+
+    assert AnalysisHistory.save_many([data, data]) == 'ok'
+
+    [(records, ordered)] = collection.inserted
+    assert ordered is False
+    assert len(records) == 2
+    assert isinstance(records[0]['timestamp'], datetime)
+    assert records[0]['job_role'] == 'Data Analyst'
+    assert records[0]['ai_recommendations'] == ['Learn R']
+
+def test_save_many_skips_empty_batch(collection):
+    assert AnalysisHistory.save_many([]) is None
+    assert collection.inserted == []
@@ -0,0 +1,50 @@
+import pytest
+from skill_analyzer import SkillAnalyzer
+
+@pytest.fixture(scope='module')
+def analyzer():
+    return SkillAnalyzer()
+
+def test_get_available_roles_without_instance():
+    assert 'Data Analyst' in SkillAnalyzer.get_available_roles()
+
+def test_analyze_uses_precomputed_skills(analyzer, monkeypatch):
+    def fail(text):
+        raise AssertionError("extract_skills should not run when found_skills is given")
+    monkeypatch.setattr(analyzer, 'extract_skills', fail)
+
+    result = analyzer.analyze('', 'Data Analyst', found_skills={'python', 'excel'})
+
+    assert result['matched_skills'] == ['python', 'excel']
+    assert 'sql' in result['missing_skills']
+    assert 'ai_error' not in result
+
+def test_analyze_matches_extracted_skills(analyzer):
+    text = 'Python and SQL'
+
+    assert analyzer.analyze(text, 'Data Analyst') == \
+        analyzer.analyze(text, 'Data Analyst', found_skills=analyzer.extract_skills(text))
+
+class _FakeAIService:
+    def __init__(self, response):
+        self.response = response
+
+    def analyze_resume(self, resume_text, job_role):
+        return self.response
+
+def test_analyze_flags_failed_ai_call(analyzer, monkeypatch):
+    monkeypatch.setattr(analyzer, 'ai_service', _FakeAIService(None))
+
+    result = analyzer.analyze('Python', 'Data Analyst')
+
+    assert result['ai_error']
+    assert result['readiness_score'] == result['match_percentage']
+
+def test_analyze_uses_ai_response(analyzer, monkeypatch):
+    monkeypatch.setattr(analyzer, 'ai_service', _FakeAIService({'readiness_score': 77, 'best_fit_role': 'Data Engineer'}))
+
+    result = analyzer.analyze('Python', 'Data Analyst')
+
+    assert 'ai_error' not in result
+    assert result['readiness_score'] == 77
+    assert result['ai_insights']['best_fit_role'] == 'Data Engineer'